@@ -8,6 +8,10 @@ from shannon.bus import EventBus
 from shannon.config import ShannonConfig
 from shannon.events import AutonomousTrigger, UserInput, VisionFrame
 
+# Cooldowns and idle time are measured on the monotonic clock, which has an
+# arbitrary epoch — "never fired" must compare as infinitely long ago.
+_NEVER = float("-inf")
+
 
 class AutonomyLoop:
     """Background loop that emits AutonomousTrigger when conditions are met."""
@@ -17,7 +21,7 @@ class AutonomyLoop:
         self._config = config
         self._running = False
         self._last_trigger_times: dict[str, float] = {}
-        self._last_input_time = time.time()
+        self._last_input_time = time.monotonic()
         self._last_frame_hash = ""
         self._latest_frame: VisionFrame | None = None
         self._last_checked_frame: VisionFrame | None = None
@@ -43,18 +47,18 @@ class AutonomyLoop:
         self._latest_frame = event
 
     async def _on_user_input(self, event: UserInput) -> None:
-        self._last_input_time = time.time()
+        self._last_input_time = time.monotonic()
 
     async def _evaluate(self) -> None:
         """Check trigger conditions and emit AutonomousTrigger if warranted."""
-        now = time.time()
+        now = time.monotonic()
         cfg = self._config.autonomy
         cooldown = cfg.cooldown_seconds
         triggers = cfg.triggers
 
         # Check idle_timeout trigger (per-trigger cooldown)
         if "idle_timeout" in triggers:
-            if now - self._last_trigger_times.get("idle_timeout", 0.0) >= cooldown:
+            if now - self._last_trigger_times.get("idle_timeout", _NEVER) >= cooldown:
                 idle_seconds = now - self._last_input_time
                 if idle_seconds >= cfg.idle_timeout_seconds:
                     self._last_trigger_times["idle_timeout"] = now
@@ -67,7 +71,7 @@ class AutonomyLoop:
 
         # Check screen_change trigger (per-trigger cooldown)
         if "screen_change" in triggers and self._latest_frame is not None:
-            if now - self._last_trigger_times.get("screen_change", 0.0) >= cooldown:
+            if now - self._last_trigger_times.get("screen_change", _NEVER) >= cooldown:
                 if self._latest_frame is not self._last_checked_frame:
                     self._last_checked_frame = self._latest_frame
                     frame_hash = hashlib.md5(self._latest_frame.image).hexdigest()
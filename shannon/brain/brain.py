@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -65,8 +66,11 @@ class Brain:
         self._registry = registry
         self._config = config
         self._tts = tts
+        # Hashed once so per-participant admin checks are O(1).
+        self._admin_ids = frozenset(config.messaging.admin_ids)
         self._history: list[LLMMessage] = []
-        self._vision_buffer: list[VisionFrame] = []
+        # Only the latest frame is kept; deque drops the oldest in O(1).
+        self._vision_buffer: deque[VisionFrame] = deque(maxlen=1)
         self._prompt_builder: PromptBuilder | None = None
         self._lock = asyncio.Lock()
 
@@ -126,7 +130,7 @@ class Brain:
         if event.custom_emojis and self._config.messaging.reaction_probability > 0:
             suffix_parts.append(event.custom_emojis)
         if event.participants:
-            admin_ids = self._config.messaging.admin_ids
+            admin_ids = self._admin_ids
             names = []
             for uid, display_name in event.participants.items():
                 if uid in admin_ids:
@@ -199,8 +203,11 @@ class Brain:
         responses = await self._process_input(request)
 
         # Synthesize TTS audio for voice channel playback
-        if self._tts is not None and responses and any(r.strip() for r in responses):
-            full_text = "\n".join(r for r in responses if r.strip())
+        if self._tts is None:
+            return
+        # One strip per response; the join is empty exactly when none has content.
+        full_text = "\n".join(r for r in responses if r.strip())
+        if full_text:
             try:
                 chunk = await self._tts.synthesize(full_text)
                 await self._bus.publish(VoiceOutput(
@@ -218,8 +225,6 @@ class Brain:
 
     async def _on_vision_frame(self, event: VisionFrame) -> None:
         self._vision_buffer.append(event)
-        if len(self._vision_buffer) > 1:
-            self._vision_buffer = self._vision_buffer[-1:]
 
     # ------------------------------------------------------------------
     # Core processing
@@ -253,17 +258,9 @@ class Brain:
             ]
             max_history = self._config.memory.max_session_messages
             if max_history > 0:
-                # Copy to prevent mutation of stored history during the tool loop
-                messages.extend(
-                    LLMMessage(
-                        role=m.role,
-                        content=m.content if isinstance(m.content, str) else list(m.content),
-                        images=list(m.images),
-                        tool_calls=list(m.tool_calls),
-                        tool_results=list(m.tool_results),
-                    )
-                    for m in self._history[-max_history:]
-                )
+                # History entries are text-only and the tool loop only appends
+                # new messages, so the stored objects can be shared as-is.
+                messages.extend(self._history[-max_history:])
 
             # Current user turn
             user_msg = LLMMessage(role="user", content=text, images=vision_images + list(request.images))
@@ -287,26 +284,33 @@ class Brain:
                 llm_response = await self._claude.generate(messages=messages, tools=tools, betas=betas)
 
                 # Strip images after first send to avoid re-transmitting on tool loops
-                if _iteration == 0:
-                    for msg in messages:
-                        if msg.images:
-                            msg.images = []
+                # (only the current user turn carries images; history is text-only)
+                if _iteration == 0 and user_msg.images:
+                    user_msg.images = []
 
                 if llm_response.tool_calls:
                     tool_names = [tc.name for tc in llm_response.tool_calls]
                     logger.info("LLM requested tools: %s", ", ".join(tool_names))
-                logger.debug("LLM response text: %s", llm_response.text[:200] if llm_response.text else "(empty)")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("LLM response text: %s", llm_response.text[:200] if llm_response.text else "(empty)")
 
                 # Process tool calls and collect results
                 expressions: list[dict] = []
                 actions: list[dict] = []
                 tool_results: list[dict] = []
+                # tool_use blocks to echo back. Only client-side calls are
+                # included — server-side ones are handled by the API and must
+                # not appear without a matching tool_result.
+                client_calls: list[dict] = []
                 wants_continue = False
 
                 for tool_call in llm_response.tool_calls:
                     # Skip server-side tools — results are already in the response
                     if self._dispatcher.is_server_side(tool_call.name):
                         continue
+                    client_calls.append(
+                        {"id": tool_call.id, "name": tool_call.name, "arguments": tool_call.arguments}
+                    )
 
                     if self._dispatcher.is_continue(tool_call.name):
                         wants_continue = True
@@ -356,22 +360,12 @@ class Brain:
 
                 # Server-side tool loop paused — re-send to continue
                 if llm_response.stop_reason == "pause_turn":
-                    # Only include client-side tool_use blocks — server-side
-                    # ones are handled by the API and must not appear without
-                    # a matching tool_result.
-                    client_calls = [
-                        tc for tc in llm_response.tool_calls
-                        if not self._dispatcher.is_server_side(tc.name)
-                    ]
                     if client_calls:
                         messages.append(
                             LLMMessage(
                                 role="assistant",
                                 content=llm_response.text,
-                                tool_calls=[
-                                    {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
-                                    for tc in client_calls
-                                ],
+                                tool_calls=client_calls,
                             )
                         )
                         if tool_results:
@@ -390,21 +384,11 @@ class Brain:
                     break
 
                 # Feed tool results back to LLM for the next iteration.
-                # Only include client-side tool_use blocks — server-side
-                # ones are handled by the API and must not appear without
-                # a matching tool_result.
-                client_calls = [
-                    tc for tc in llm_response.tool_calls
-                    if not self._dispatcher.is_server_side(tc.name)
-                ]
                 messages.append(
                     LLMMessage(
                         role="assistant",
                         content=llm_response.text,
-                        tool_calls=[
-                            {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
-                            for tc in client_calls
-                        ],
+                        tool_calls=client_calls,
                     )
                 )
                 messages.append(
@@ -439,8 +423,10 @@ class Brain:
             if combined_text:
                 # Store original text without [Context: ...] prefix
                 history_content = user_msg.content if isinstance(user_msg.content, str) else str(user_msg.content)
-                if history_content.startswith("[Context: ") and "]\n" in history_content:
-                    history_content = history_content[history_content.index("]\n") + 2:]
+                if history_content.startswith("[Context: "):
+                    _, sep, rest = history_content.partition("]\n")
+                    if sep:
+                        history_content = rest
                 self._history.append(LLMMessage(role="user", content=history_content))
                 self._history.append(LLMMessage(
                     role="assistant",
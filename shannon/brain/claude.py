@@ -23,6 +23,47 @@ def _detect_media_type(image_bytes: bytes) -> str:
     return "image/png"
 
 
+def _to_blocks(content: Any) -> list[dict[str, Any]]:
+    if isinstance(content, list):
+        return content
+    if isinstance(content, str) and content:
+        return [{"type": "text", "text": content}]
+    return []
+
+
+def _has_tool_blocks(content: Any) -> bool:
+    if not isinstance(content, list):
+        return False
+    return any(
+        isinstance(b, dict) and b.get("type") in ("tool_use", "tool_result")
+        for b in content
+    )
+
+
+def _append_normalized(merged: list[dict[str, Any]], msg: dict[str, Any]) -> None:
+    """Append *msg*, merging it into the previous message if roles match.
+
+    Lets _build_messages enforce alternation as it goes instead of making a
+    second pass over the built list.
+    """
+    if not merged:
+        merged.append(msg)
+        return
+    prev = merged[-1]
+    if prev["role"] != msg["role"]:
+        merged.append(msg)
+        return
+    if _has_tool_blocks(prev["content"]) or _has_tool_blocks(msg["content"]):
+        merged.append(msg)
+        return
+    combined = _to_blocks(prev["content"]) + _to_blocks(msg["content"])
+    if combined:
+        merged[-1] = {"role": msg["role"], "content": combined}
+    else:
+        # Both empty — don't merge into ""; keep as separate messages
+        merged.append(msg)
+
+
 class ClaudeClient:
     """Thin wrapper around the Anthropic SDK for Shannon's brain."""
 
@@ -48,6 +89,8 @@ class ClaudeClient:
             cache_control applied), or None if no system message was present.
         """
         system_blocks: list[dict[str, Any]] | None = None
+        # Same-role neighbours are merged as they are appended (see
+        # _append_normalized), so the result already alternates strictly.
         api_messages: list[dict[str, Any]] = []
 
         for msg in messages:
@@ -66,7 +109,7 @@ class ClaudeClient:
 
             # Compaction: content is already a list of API blocks — pass through.
             if isinstance(msg.content, list):
-                api_messages.append({"role": msg.role, "content": msg.content})
+                _append_normalized(api_messages, {"role": msg.role, "content": msg.content})
                 continue
 
             if msg.tool_results:
@@ -79,92 +122,46 @@ class ClaudeClient:
                     }
                     for result in msg.tool_results
                 ]
-                api_messages.append({"role": "user", "content": content})
+                _append_normalized(api_messages, {"role": "user", "content": content})
                 continue
 
             if msg.tool_calls:
                 # Assistant message with tool_use blocks.
-                content = []
-                if msg.content:
-                    content.append({"type": "text", "text": msg.content})
-                for call in msg.tool_calls:
-                    content.append({
+                content = [{"type": "text", "text": msg.content}] if msg.content else []
+                content.extend(
+                    {
                         "type": "tool_use",
                         "id": call["id"],
                         "name": call["name"],
                         "input": call["arguments"],
-                    })
-                api_messages.append({"role": "assistant", "content": content})
+                    }
+                    for call in msg.tool_calls
+                )
+                _append_normalized(api_messages, {"role": "assistant", "content": content})
                 continue
 
-            # Regular text (+ optional images).
-            content = []
-            for image_bytes in msg.images:
-                b64 = base64.standard_b64encode(image_bytes).decode("ascii")
-                content.append({
+            # Plain text — the common case; no block list needed.
+            if not msg.images:
+                _append_normalized(api_messages, {"role": msg.role, "content": msg.content})
+                continue
+
+            # Text with images.
+            content = [
+                {
                     "type": "image",
                     "source": {
                         "type": "base64",
                         "media_type": _detect_media_type(image_bytes),
-                        "data": b64,
+                        "data": base64.standard_b64encode(image_bytes).decode("ascii"),
                     },
-                })
+                }
+                for image_bytes in msg.images
+            ]
             if msg.content:
                 content.append({"type": "text", "text": msg.content})
+            _append_normalized(api_messages, {"role": msg.role, "content": content})
 
-            if len(content) == 1 and content[0]["type"] == "text":
-                api_messages.append({"role": msg.role, "content": msg.content})
-            elif content:
-                api_messages.append({"role": msg.role, "content": content})
-            else:
-                api_messages.append({"role": msg.role, "content": ""})
-
-        return system_blocks, self._normalize_messages(api_messages)
-
-    @staticmethod
-    def _normalize_messages(api_messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Merge consecutive same-role messages to ensure strict alternation.
-
-        Messages containing tool_use or tool_result blocks are never merged,
-        to preserve the required tool_use -> tool_result pairing.
-        """
-        if not api_messages:
-            return api_messages
-
-        def _to_blocks(content: Any) -> list[dict[str, Any]]:
-            if isinstance(content, list):
-                return content
-            if isinstance(content, str) and content:
-                return [{"type": "text", "text": content}]
-            return []
-
-        def _has_tool_blocks(content: Any) -> bool:
-            if not isinstance(content, list):
-                return False
-            return any(
-                isinstance(b, dict) and b.get("type") in ("tool_use", "tool_result")
-                for b in content
-            )
-
-        merged: list[dict[str, Any]] = [api_messages[0]]
-        for msg in api_messages[1:]:
-            prev = merged[-1]
-            if prev["role"] == msg["role"]:
-                if _has_tool_blocks(prev["content"]) or _has_tool_blocks(msg["content"]):
-                    merged.append(msg)
-                    continue
-                prev_blocks = _to_blocks(prev["content"])
-                new_blocks = _to_blocks(msg["content"])
-                combined = prev_blocks + new_blocks
-                if combined:
-                    merged[-1] = {"role": msg["role"], "content": combined}
-                else:
-                    # Both empty — don't merge into ""; keep as separate messages
-                    merged.append(msg)
-            else:
-                merged.append(msg)
-
-        return merged
+        return system_blocks, api_messages
 
     # ------------------------------------------------------------------
     # Response parsing
@@ -179,8 +176,8 @@ class ClaudeClient:
         text_parts: list[str] = []
         tool_calls: list[LLMToolCall] = []
 
-        block_types = [block.type for block in response.content]
-        logger.debug("Response block types: %s", block_types)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response block types: %s", [block.type for block in response.content])
 
         for block in response.content:
             btype = block.type
@@ -7,6 +7,18 @@ _REACTION_PATTERN = re.compile(r"\[react:\s*([^\]]+)\]")
 
 def extract_reactions(text: str) -> tuple[str, list[str]]:
     """Strip [react: emoji] markers from text and return (clean_text, reactions)."""
-    reactions = _REACTION_PATTERN.findall(text)
-    clean = _REACTION_PATTERN.sub("", text).strip()
-    return clean, [r.strip() for r in reactions if r.strip()]
+    # Most responses carry no markers — skip the regex engine entirely.
+    if "[react:" not in text:
+        return text.strip(), []
+
+    reactions: list[str] = []
+
+    def _collect(match: re.Match[str]) -> str:
+        emoji = match.group(1).strip()
+        if emoji:
+            reactions.append(emoji)
+        return ""
+
+    # One scan both collects and removes the markers.
+    clean = _REACTION_PATTERN.sub(_collect, text).strip()
+    return clean, reactions
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import uuid
 from typing import Any
@@ -56,6 +57,10 @@ class ToolDispatcher:
         self.channel_id: str = ""
         self.participants: dict[str, str] = {}
         self._pending_confirmations: dict[str, asyncio.Future[bool]] = {}
+        # One random prefix per dispatcher keeps IDs unique across restarts;
+        # the per-request suffix is just a counter.
+        self._confirmation_prefix = uuid.uuid4().hex[:8]
+        self._confirmation_counter = itertools.count(1)
 
         if bus is not None:
             from shannon.events import ToolConfirmationResponse
@@ -101,7 +106,7 @@ class ToolDispatcher:
         """Publish a confirmation request and wait for a response."""
         from shannon.events import ToolConfirmationRequest
 
-        request_id = uuid.uuid4().hex
+        request_id = f"{self._confirmation_prefix}-{next(self._confirmation_counter)}"
         description = self._describe_tool_call(name, args)
 
         loop = asyncio.get_running_loop()
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMMessage:
     """A message in the conversation.
 
@@ -18,7 +18,7 @@ class LLMMessage:
     tool_results: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenerationRequest:
     """Everything the brain needs to produce a response — immutable after creation.
 
@@ -33,7 +33,7 @@ class GenerationRequest:
     participants: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMToolCall:
     """A tool call requested by the LLM."""
     id: str
@@ -41,7 +41,7 @@ class LLMToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
     """Response from an LLM provider."""
     text: str
@@ -1,33 +1,66 @@
 """Typed async event bus — publish/subscribe pattern."""
 
+import asyncio
 import logging
-from collections import defaultdict
 from typing import Any, Callable, Coroutine
 
 logger = logging.getLogger(__name__)
 
+Handler = Callable[..., Coroutine[Any, Any, None]]
+
 
 class EventBus:
     """Central event bus. Modules subscribe to event types and publish events."""
 
     def __init__(self) -> None:
-        self._subscribers: dict[type, list[Callable[..., Coroutine[Any, Any, None]]]] = defaultdict(list)
+        # Copy-on-write: subscribe/unsubscribe replace the tuple, so publish
+        # can iterate the current snapshot without copying it per event.
+        self._subscribers: dict[type, tuple[Handler, ...]] = {}
 
-    def subscribe(self, event_type: type, handler: Callable[..., Coroutine[Any, Any, None]]) -> None:
+    def subscribe(self, event_type: type, handler: Handler) -> None:
         """Register a handler for an event type."""
-        self._subscribers[event_type].append(handler)
+        self._subscribers[event_type] = (*self._subscribers.get(event_type, ()), handler)
 
-    def unsubscribe(self, event_type: type, handler: Callable[..., Coroutine[Any, Any, None]]) -> None:
+    def unsubscribe(self, event_type: type, handler: Handler) -> None:
         """Remove a handler for an event type."""
-        try:
-            self._subscribers[event_type].remove(handler)
-        except ValueError:
-            pass
+        handlers = self._subscribers.get(event_type)
+        if not handlers or handler not in handlers:
+            return
+        i = handlers.index(handler)
+        remaining = handlers[:i] + handlers[i + 1:]
+        if remaining:
+            self._subscribers[event_type] = remaining
+        else:
+            del self._subscribers[event_type]
+
+    def has_subscribers(self, event_type: type) -> bool:
+        """Return True if any handler is registered for *event_type*.
+
+        Lets publishers skip building events nobody will receive.
+        """
+        return event_type in self._subscribers
 
     async def publish(self, event: Any) -> None:
-        """Publish an event to all subscribers of its type."""
-        for handler in list(self._subscribers.get(type(event), [])):
-            try:
-                await handler(event)
-            except Exception:
-                logger.exception("Unhandled exception in event handler %r for event %r", handler, event)
+        """Publish an event to all subscribers of its type.
+
+        Handlers run concurrently, so one slow handler (e.g. an LLM call)
+        doesn't hold up the others; publish returns once all have finished.
+        """
+        handlers = self._subscribers.get(type(event), ())
+        if len(handlers) == 1:
+            # Common case — skip the task wrapping gather would add.
+            await self._call(handlers[0], event)
+        elif handlers:
+            await asyncio.gather(*(self._call(handler, event) for handler in handlers))
+
+    @staticmethod
+    async def _call(handler: Handler, event: Any) -> None:
+        try:
+            await handler(event)
+        except Exception:
+            # Log the event type, not repr(event): frames and audio carry
+            # megabytes of bytes that would be formatted into the record.
+            logger.exception(
+                "Unhandled exception in event handler %r for %s event",
+                handler, type(event).__name__,
+            )
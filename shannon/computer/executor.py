@@ -18,6 +18,15 @@ from shannon.computer.screenshot import ScreenCapture
 
 _MAX_DURATION = 30.0  # seconds — cap for hold_key and wait actions
 
+# Click action → pyautogui function name.
+_CLICK_FUNCS: dict[str, str] = {
+    "left_click": "click",
+    "right_click": "rightClick",
+    "middle_click": "middleClick",
+    "double_click": "doubleClick",
+    "triple_click": "tripleClick",
+}
+
 
 class ComputerUseExecutor:
     """Executes computer use actions dispatched from the computer_20251124 tool.
@@ -168,21 +177,13 @@ class ComputerUseExecutor:
         # ---- click actions ----
         # Click/scroll actions support modifier keys via the "text" param
         # (e.g. "shift", "ctrl", "alt", "super" for shift+click, ctrl+click, etc.)
-        if action in ("left_click", "right_click", "middle_click", "double_click", "triple_click"):
+        click_func = _CLICK_FUNCS.get(action)
+        if click_func is not None:
             modifier = params.get("text")
             if modifier:
                 pyautogui.keyDown(modifier)
             try:
-                if action == "left_click":
-                    pyautogui.click(x, y)
-                elif action == "right_click":
-                    pyautogui.rightClick(x, y)
-                elif action == "middle_click":
-                    pyautogui.middleClick(x, y)
-                elif action == "double_click":
-                    pyautogui.doubleClick(x, y)
-                elif action == "triple_click":
-                    pyautogui.tripleClick(x, y)
+                getattr(pyautogui, click_func)(x, y)
             finally:
                 if modifier:
                     pyautogui.keyUp(modifier)
@@ -1,18 +1,22 @@
 # shannon/config.py
 """Configuration loading and validation."""
 
+import copy
 import logging
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 _log = logging.getLogger(__name__)
 
 _SKIP_VALIDATION = False
 
+# Parsed YAML per resolved path, stamped with (mtime_ns, size) — repeated loads
+# of an unchanged file skip parsing. Entries are deep-copied out because merged
+# lists are assigned to config fields by reference.
+_YAML_CACHE: dict[str, tuple[int, int, dict]] = {}
+
 
 def _clamp(value: float, lo: float, hi: float, name: str) -> float:
     """Clamp a value to [lo, hi], logging a warning if out of range."""
@@ -220,17 +224,26 @@ class ShannonConfig:
 
 
 def _merge_dataclass(instance: Any, overrides: dict) -> None:
-    """Recursively merge a dict of overrides into a dataclass instance."""
-    visited_keys: set[str] = set()
-    for key, value in overrides.items():
-        if not hasattr(instance, key):
-            _log.warning("Unknown config key %r — ignored (typo?)", key)
-            continue
-        visited_keys.add(key)
-        current = getattr(instance, key)
-        if isinstance(value, dict) and hasattr(current, "__dataclass_fields__"):
-            _merge_dataclass(current, value)
-        else:
+    """Merge a dict of overrides into a dataclass instance and its nested fields.
+
+    Walks the tree with an explicit stack, then runs ``__post_init__``
+    validators children-first, as the recursive version did.
+    """
+    stack: list[tuple[Any, dict]] = [(instance, overrides)]
+    merged: list[Any] = []
+    while stack:
+        node, node_overrides = stack.pop()
+        merged.append(node)
+        visited_keys: set[str] = set()
+        for key, value in node_overrides.items():
+            if not hasattr(node, key):
+                _log.warning("Unknown config key %r — ignored (typo?)", key)
+                continue
+            visited_keys.add(key)
+            current = getattr(node, key)
+            if isinstance(value, dict) and hasattr(current, "__dataclass_fields__"):
+                stack.append((current, value))
+                continue
             # Type coercion: bool before int (bool is subclass of int)
             if isinstance(current, list) and not isinstance(value, list):
                 value = [value] if value is not None else []
@@ -248,18 +261,18 @@ def _merge_dataclass(instance: Any, overrides: dict) -> None:
                 except (ValueError, TypeError):
                     _log.warning("Cannot convert %r to float for %s; skipping", value, key)
                     continue
-            setattr(instance, key, value)
-    # Recurse into nested dataclass fields that were NOT in overrides,
-    # so their __post_init__ validators still run.
-    if hasattr(instance, "__dataclass_fields__"):
-        for field_name in instance.__dataclass_fields__:
+            setattr(node, key, value)
+        # Visit nested dataclass fields that were NOT in overrides,
+        # so their __post_init__ validators still run.
+        for field_name in getattr(node, "__dataclass_fields__", ()):
             if field_name not in visited_keys:
-                child = getattr(instance, field_name)
+                child = getattr(node, field_name)
                 if hasattr(child, "__dataclass_fields__"):
-                    _merge_dataclass(child, {})
-    # Re-run validation after merging overrides
-    if hasattr(instance, "__post_init__"):
-        instance.__post_init__()
+                    stack.append((child, {}))
+    # Re-run validation after merging overrides, children before parents
+    for node in reversed(merged):
+        if hasattr(node, "__post_init__"):
+            node.__post_init__()
 
 
 def _build_defaults() -> ShannonConfig:
@@ -273,13 +286,31 @@ def _build_defaults() -> ShannonConfig:
     return config
 
 
+def _read_yaml(path: Path) -> dict:
+    """Parse a YAML file, reusing the cached result while the file is unchanged."""
+    stat = path.stat()
+    key = str(path.resolve())
+    entry = _YAML_CACHE.get(key)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        data = entry[2]
+    else:
+        # Imported lazily: callers that only need defaults never pay for it.
+        import yaml
+
+        # libyaml's C loader is several times faster than the pure-Python one.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path) as f:
+            data = yaml.load(f, Loader=loader) or {}
+        _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy.deepcopy(data)
+
+
 def load_config(path: str | Path) -> ShannonConfig:
     """Load config from a YAML file, merging over defaults."""
     config = _build_defaults()
     path = Path(path)
     if path.exists():
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_yaml(path)
         _merge_dataclass(config, data)
     else:
         # No config file — still need to validate defaults
@@ -5,14 +5,14 @@ from time import time
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInput:
     """User text or voice input."""
     text: str
     source: str  # "text" | "voice"
 
 
-@dataclass
+@dataclass(slots=True)
 class VisionFrame:
     """Captured image from screen or webcam."""
     image: bytes
@@ -20,14 +20,14 @@ class VisionFrame:
     timestamp: float = field(default_factory=time)
 
 
-@dataclass
+@dataclass(slots=True)
 class AutonomousTrigger:
     """Autonomy loop decided Shannon should react."""
     reason: str  # "screen_change" | "idle_timeout"
     context: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Structured response from the LLM."""
     text: str
@@ -36,27 +36,27 @@ class LLMResponse:
     mood: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechStart:
     """TTS started playing audio."""
     duration: float
     phonemes: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechEnd:
     """TTS finished playing audio."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionChange:
     """Request to change VTuber expression."""
     name: str
     intensity: float  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigChange:
     """A configuration value was changed at runtime."""
     key: str
@@ -64,7 +64,7 @@ class ConfigChange:
     new_value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """Incoming message from an external chat platform."""
     text: str
@@ -80,7 +80,7 @@ class ChatMessage:
     is_dm: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     """Outgoing response to an external chat platform."""
     text: str
@@ -90,7 +90,7 @@ class ChatResponse:
     reactions: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatReaction:
     """Request to add an emoji reaction to a message."""
     emoji: str
@@ -99,7 +99,7 @@ class ChatReaction:
     message_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolConfirmationRequest:
     """Request user approval before executing a tool."""
     tool_name: str
@@ -107,14 +107,14 @@ class ToolConfirmationRequest:
     request_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolConfirmationResponse:
     """User's approval/denial of a tool execution."""
     request_id: str
     approved: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceInput:
     """Batched transcription from voice channel after silence gap."""
     text: str
@@ -123,7 +123,7 @@ class VoiceInput:
     platform: str = "discord"
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceOutput:
     """TTS audio to play in a voice channel."""
     audio: object  # AudioChunk — typed as object to avoid circular import
@@ -131,7 +131,7 @@ class VoiceOutput:
     platform: str = "discord"
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceStateChange:
     """User joined/left a voice channel."""
     user_id: str
@@ -147,20 +147,6 @@ class MessagingManager:
         if existing and not existing.done():
             existing.cancel()
 
-        event = ChatMessage(
-            text=text,
-            author=author,
-            platform=platform,
-            channel=channel_id,
-            message_id=message_id,
-            attachments=attachments,
-            is_reply_to_bot=is_reply_to_bot,
-            is_mention=is_mention,
-            custom_emojis=custom_emojis,
-            participants=participants or {},
-            is_dm=is_dm,
-        )
-
         async def _typing_loop(provider: "MessagingProvider", ch_id: str) -> None:
             """Send typing indicators every 5s until cancelled."""
             try:
@@ -189,6 +175,22 @@ class MessagingManager:
                     except asyncio.CancelledError:
                         return
 
+                # Built only once the debounce survives, so messages
+                # superseded mid-burst never allocate an event.
+                event = ChatMessage(
+                    text=text,
+                    author=author,
+                    platform=platform,
+                    channel=channel_id,
+                    message_id=message_id,
+                    attachments=attachments,
+                    is_reply_to_bot=is_reply_to_bot,
+                    is_mention=is_mention,
+                    custom_emojis=custom_emojis,
+                    participants=participants or {},
+                    is_dm=is_dm,
+                )
+
                 # Keep typing indicator alive during LLM generation
                 if provider:
                     typing_task = asyncio.create_task(_typing_loop(provider, channel_id))
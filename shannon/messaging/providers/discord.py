@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any, Callable, Coroutine
 
 from shannon.messaging.providers.base import MessagingProvider
@@ -12,6 +13,11 @@ logger = logging.getLogger(__name__)
 DISCORD_MAX_LENGTH = 2000
 _MAX_ATTACHMENT_BYTES = 10 * 1024 * 1024  # 10 MB
 
+# Used with .match(text, pos).end() to skip separator runs in C rather than a
+# per-character Python loop. \s matches exactly the str.isspace() set.
+_NEWLINES_RE = re.compile(r"\n*")
+_WHITESPACE_RE = re.compile(r"\s*")
+
 
 def split_message(text: str) -> list[str]:
     """Split text into chunks that fit within Discord's 2000-char limit.
@@ -23,52 +29,61 @@ def split_message(text: str) -> list[str]:
     if len(text) <= DISCORD_MAX_LENGTH:
         return [text]
 
+    # Walk a cursor over ``text`` instead of re-slicing the remainder after
+    # every chunk, which copied the rest of the message each time.
     chunks: list[str] = []
-    remaining = text
-    while remaining:
-        if len(remaining) <= DISCORD_MAX_LENGTH:
-            chunk = remaining.strip()
+    n = len(text)
+    pos = 0
+    # Check once which separators occur at all, so chunks of plain prose do
+    # not rescan the window for delimiters that are never there.
+    has_newline = "\n" in text
+    sentence_puncs = tuple(p for p in (". ", "! ", "? ") if p in text)
+    while pos < n:
+        if n - pos <= DISCORD_MAX_LENGTH:
+            chunk = text[pos:].strip()
             if chunk:
                 chunks.append(chunk)
             break
+        end = pos + DISCORD_MAX_LENGTH
 
         # Try to split on newline
-        cut = remaining.rfind("\n", 0, DISCORD_MAX_LENGTH)
+        cut = text.rfind("\n", pos, end) if has_newline else -1
         if cut != -1:
-            chunk = remaining[:cut].strip()
+            chunk = text[pos:cut].strip()
             if chunk:
                 chunks.append(chunk)
-            remaining = remaining[cut:].lstrip("\n")
+            pos = _NEWLINES_RE.match(text, cut).end()
             continue
 
         # Try to split on sentence boundary
         best_sentence = -1
-        for punc in (". ", "! ", "? "):
-            idx = remaining.rfind(punc, 0, DISCORD_MAX_LENGTH)
-            if idx > best_sentence:
-                best_sentence = idx + 1  # include the punctuation mark
+        for punc in sentence_puncs:
+            idx = text.rfind(punc, pos, end)
+            if idx != -1 and idx - pos > best_sentence:
+                best_sentence = idx - pos + 1  # include the punctuation mark
 
         if best_sentence > 0:
-            chunk = remaining[:best_sentence].strip()
+            cut = pos + best_sentence
+            chunk = text[pos:cut].strip()
             if chunk:
                 chunks.append(chunk)
-            remaining = remaining[best_sentence:].lstrip()
+            pos = _WHITESPACE_RE.match(text, cut).end()
             continue
 
         # Try to split on space
-        cut = remaining.rfind(" ", 0, DISCORD_MAX_LENGTH)
+        cut = text.rfind(" ", pos, end)
         if cut != -1:
-            chunk = remaining[:cut].strip()
+            chunk = text[pos:cut].strip()
             if chunk:
                 chunks.append(chunk)
-            remaining = remaining[cut + 1:]
+            pos = cut + 1
             continue
 
         # Hard cut
-        chunk = remaining[:DISCORD_MAX_LENGTH].strip()
+        chunk = text[pos:end].strip()
         if chunk:
             chunks.append(chunk)
-        remaining = remaining[DISCORD_MAX_LENGTH:]
+        pos = end
 
     return chunks
 
@@ -87,6 +102,10 @@ class DiscordProvider(MessagingProvider):
         self._callback: Callable[..., Coroutine[Any, Any, None]] | None = None
         self._client: Any = None  # discord.Client, typed as Any to avoid hard import at module level
         self._client_task: Any = None
+        # guild id -> (guild.emojis it was built from, rendered line).
+        # discord.py replaces the emojis tuple on every emoji update, so an
+        # identity check is enough to know the cached line is still current.
+        self._emoji_lines: dict[int, tuple[Any, str]] = {}
 
     @property
     def client(self) -> Any:
@@ -113,23 +132,7 @@ class DiscordProvider(MessagingProvider):
             if message.author.bot:
                 return
             if self._callback is not None:
-                # Download attachments
-                attachments: list[dict] = []
-                for att in message.attachments:
-                    if att.size > _MAX_ATTACHMENT_BYTES:
-                        logger.warning(
-                            "Skipping attachment %s — too large (%d bytes)", att.filename, att.size
-                        )
-                        continue
-                    try:
-                        data = await att.read()
-                        attachments.append({
-                            "filename": att.filename,
-                            "content_type": att.content_type or "",
-                            "data": data,
-                        })
-                    except Exception:
-                        logger.debug("Failed to download attachment %s", att.filename)
+                attachments = await self._download_attachments(message.attachments)
 
                 # Detect reply-to-bot
                 is_reply_to_bot = False
@@ -176,9 +179,40 @@ class DiscordProvider(MessagingProvider):
                 )
 
         # Start the client in the background without blocking.
-        self._client_task = asyncio.ensure_future(self._client.start(self._token))
+        self._client_task = asyncio.create_task(self._client.start(self._token))
         self._client_task.add_done_callback(self._on_client_done)
 
+    @staticmethod
+    async def _download_attachments(message_attachments: Any) -> list[dict]:
+        """Download attachments concurrently, keeping message order.
+
+        Oversized attachments and failed downloads are skipped.
+        """
+        import asyncio
+
+        wanted = []
+        for att in message_attachments:
+            if att.size > _MAX_ATTACHMENT_BYTES:
+                logger.warning(
+                    "Skipping attachment %s — too large (%d bytes)", att.filename, att.size
+                )
+                continue
+            wanted.append(att)
+        downloads = await asyncio.gather(
+            *(att.read() for att in wanted), return_exceptions=True
+        )
+        attachments: list[dict] = []
+        for att, data in zip(wanted, downloads):
+            if isinstance(data, BaseException):
+                logger.debug("Failed to download attachment %s", att.filename)
+                continue
+            attachments.append({
+                "filename": att.filename,
+                "content_type": att.content_type or "",
+                "data": data,
+            })
+        return attachments
+
     async def disconnect(self) -> None:
         """Close the Discord client connection."""
         if self._client is not None:
@@ -214,7 +248,9 @@ class DiscordProvider(MessagingProvider):
             try:
                 if i == 0 and reply_to:
                     try:
-                        original = await discord_channel.fetch_message(int(reply_to))
+                        # A partial message is enough to reply to and skips
+                        # the extra REST round trip of fetch_message().
+                        original = discord_channel.get_partial_message(int(reply_to))
                         await original.reply(chunk)
                     except Exception:
                         logger.debug("Failed to reply to message %s, sending as standalone", reply_to)
@@ -247,7 +283,7 @@ class DiscordProvider(MessagingProvider):
             discord_channel = self._client.get_channel(int(channel))
             if discord_channel is None:
                 discord_channel = await self._client.fetch_channel(int(channel))
-            message = await discord_channel.fetch_message(int(message_id))
+            message = discord_channel.get_partial_message(int(message_id))
             await message.add_reaction(emoji)
         except Exception:
             pass
@@ -258,11 +294,17 @@ class DiscordProvider(MessagingProvider):
         """Build a string listing available custom emoji for context."""
         if not guild or not guild.emojis:
             return ""
-        names = [f":{e.name}:" for e in guild.emojis if e.available]
-        if not names:
-            return ""
-        names = names[:self._MAX_EMOJIS]
-        return f"Custom emojis: {', '.join(names)}"
+        emojis = guild.emojis
+        cached = self._emoji_lines.get(guild.id)
+        if cached is not None and cached[0] is emojis:
+            return cached[1]
+        names = [f":{e.name}:" for e in emojis if e.available]
+        if names:
+            line = f"Custom emojis: {', '.join(names[:self._MAX_EMOJIS])}"
+        else:
+            line = ""
+        self._emoji_lines[guild.id] = (emojis, line)
+        return line
 
     async def _is_in_conversation(self, channel, expiry: float) -> bool:
         """Check if the bot recently replied in this channel by inspecting Discord history."""
@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import audioop
-import io
 import logging
 import struct
 import threading
 import time
-import wave
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 import discord
@@ -104,14 +103,20 @@ def pcm_mono_to_48k_stereo(data: bytes, src_rate: int) -> bytes:
 
 
 def _pcm_to_wav(pcm: bytes, sample_rate: int, channels: int) -> bytes:
-    """Wrap raw 16-bit PCM in a WAV container."""
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-        wf.writeframes(pcm)
-    return buf.getvalue()
+    """Wrap raw 16-bit PCM in a WAV container.
+
+    Packs the 44-byte canonical header directly (the same bytes the wave
+    module writes) so the utterance is copied once, not into a BytesIO and
+    then out again.
+    """
+    block_align = channels * 2  # 16-bit
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b"data", len(pcm),
+    )
+    return header + pcm
 
 
 # ---------------------------------------------------------------------------
@@ -119,33 +124,40 @@ def _pcm_to_wav(pcm: bytes, sample_rate: int, channels: int) -> bytes:
 # ---------------------------------------------------------------------------
 
 class UserAudioBuffer:
-    """Accumulates PCM audio for a single user with max-length cap."""
+    """Accumulates PCM audio for a single user with max-length cap.
+
+    Packets are kept as a deque and only joined on drain; once the cap is
+    reached the oldest whole packets are dropped, instead of shifting the
+    entire buffer down on every 20ms frame.
+    """
 
     def __init__(self, max_seconds: float, sample_rate: int, channels: int) -> None:
         self._max_bytes = int(max_seconds * sample_rate * channels * 2)  # 16-bit
-        self._buf = bytearray()
+        self._chunks: deque[bytes] = deque()
+        self._size = 0
         self._last_activity = time.monotonic()
 
     @property
     def has_data(self) -> bool:
-        return len(self._buf) > 0
+        return self._size > 0
 
     @property
     def silence_seconds(self) -> float:
         return time.monotonic() - self._last_activity
 
     def append(self, pcm: bytes) -> None:
-        """Append PCM data, trimming oldest bytes if over cap."""
-        self._buf.extend(pcm)
-        if len(self._buf) > self._max_bytes:
-            excess = len(self._buf) - self._max_bytes
-            del self._buf[:excess]
+        """Append PCM data, dropping the oldest packets if over cap."""
+        self._chunks.append(pcm)
+        self._size += len(pcm)
+        while len(self._chunks) > 1 and self._size - len(self._chunks[0]) >= self._max_bytes:
+            self._size -= len(self._chunks.popleft())
         self._last_activity = time.monotonic()
 
     def drain(self) -> bytes:
         """Return all buffered data and clear the buffer."""
-        data = bytes(self._buf)
-        self._buf.clear()
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
         return data
 
 
@@ -182,20 +194,21 @@ class ChunkAudioSource(discord.AudioSource):
         if volume != 1.0:
             pcm = audioop.mul(pcm, 2, volume)
 
+        # Pad the tail with silence once, so every read() is a plain slice.
+        remainder = len(pcm) % FRAME_SIZE
+        if remainder:
+            pcm += b"\x00" * (FRAME_SIZE - remainder)
+
         self._data = pcm
         self._offset = 0
 
     def read(self) -> bytes:
         """Return next 20ms frame (3840 bytes) or empty bytes if done."""
-        end = self._offset + FRAME_SIZE
-        if self._offset >= len(self._data):
+        start = self._offset
+        if start >= len(self._data):
             return b""
-        frame = self._data[self._offset:end]
-        self._offset = end
-        if len(frame) < FRAME_SIZE:
-            # Pad last frame with silence
-            frame = frame + b"\x00" * (FRAME_SIZE - len(frame))
-        return frame
+        self._offset = start + FRAME_SIZE
+        return self._data[start:self._offset]
 
     def is_opus(self) -> bool:
         return False
@@ -235,6 +248,7 @@ class VoiceManager:
         self._packet_count = 0
         self._unknown_ssrcs: set[int] = set()  # SSRCs seen but not mapped
         self._hooked_ws: set[int] = set()  # id() of websockets we've hooked
+        self._playback_done: dict[str, asyncio.Event] = {}  # guild_id -> set when playback ends
 
     async def start(self) -> None:
         from shannon.events import VoiceOutput
@@ -253,6 +267,7 @@ class VoiceManager:
             except Exception:
                 logger.debug("Error disconnecting voice client", exc_info=True)
         self._voice_clients.clear()
+        self._playback_done.clear()
         self._user_buffers.clear()
 
     async def handle_voice_state_update(self, member: Any, before: Any, after: Any) -> None:
@@ -322,6 +337,7 @@ class VoiceManager:
             except Exception:
                 logger.debug("Error disconnecting from voice channel", exc_info=True)
             self._voice_clients.pop(guild_id, None)
+            self._playback_done.pop(guild_id, None)
             logger.info("Left voice channel in guild %s (empty)", guild_id)
 
     def handle_speaking_update(self, user_id: str, ssrc: int, display_name: str) -> None:
@@ -719,37 +735,56 @@ class VoiceManager:
         target_channel = event.channel
 
         target_vc = None
-        for vc in self._voice_clients.values():
+        guild_id = None
+        for gid, vc in self._voice_clients.items():
             if hasattr(vc, "channel") and vc.channel and str(vc.channel.id) == target_channel:
                 target_vc = vc
+                guild_id = gid
                 break
 
         if target_vc is None:
             logger.debug("No voice client for channel %s, dropping VoiceOutput", target_channel)
             return
 
-        # Wait for any current playback to finish (sequential queuing)
+        # Wait for any current playback to finish (sequential queuing).
+        # is_playing() decides; while our own clip is playing, sleep on the
+        # after-callback's event instead of polling.
         timeout = 30.0
-        waited = 0.0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         while target_vc.is_playing():
-            await asyncio.sleep(0.2)
-            waited += 0.2
-            if waited >= timeout:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
                 logger.warning("Playback wait timed out after %.0fs", timeout)
                 break
+            previous = self._playback_done.get(guild_id)
+            if previous is not None and not previous.is_set():
+                try:
+                    await asyncio.wait_for(previous.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(min(0.2, remaining))
 
         source = ChunkAudioSource(event.audio, volume=self._config.volume)
 
         if self._config.mute_during_playback:
             self._muted.set()
 
+        done = asyncio.Event()
+
         def after_play(error: Exception | None) -> None:
+            # Runs on discord's audio thread.
             self._muted.clear()
+            loop.call_soon_threadsafe(done.set)
             if error:
                 logger.warning("Error during voice playback: %s", error)
 
         try:
             target_vc.play(source, after=after_play)
         except Exception:
+            # Keep the previous event: whatever is still playing is not ours.
             self._muted.clear()
             logger.exception("Failed to start voice playback")
+        else:
+            self._playback_done[guild_id] = done
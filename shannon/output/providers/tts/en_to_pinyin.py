@@ -17,6 +17,7 @@ Key phonetic considerations:
 
 from __future__ import annotations
 
+import functools
 import unicodedata
 from collections.abc import Sequence
 
@@ -187,6 +188,19 @@ def _is_vowel(ch: str) -> bool:
     return ch in _IPA_VOWELS
 
 
+def _is_modifier(ch: str) -> bool:
+    """True for stress/length marks and combining diacritics (category M*)."""
+    return ch in _SKIP or unicodedata.category(ch)[0] == "M"
+
+
+def _skip_modifiers(ipa: Sequence[str], pos: int) -> int:
+    """Return the index of the first non-modifier at or after *pos*."""
+    n = len(ipa)
+    while pos < n and _is_modifier(ipa[pos]):
+        pos += 1
+    return pos
+
+
 def _match_vowel(ipa: Sequence[str], pos: int) -> tuple[str, int, bool]:
     """Match the longest vowel sequence starting at *pos*.
 
@@ -252,7 +266,7 @@ def ipa_to_pinyin(
         ch = ipa_phonemes[pos]
 
         # --- skip modifiers / combining marks ---
-        if ch in _SKIP or unicodedata.category(ch).startswith("M"):
+        if _is_modifier(ch):
             if ch == "ˈ":
                 stressed.add(pos + 1)
             elif ch == "ˌ":
@@ -283,7 +297,7 @@ def ipa_to_pinyin(
         onset_queue: list[str] = []
         while pos < n and not _is_vowel(ipa_phonemes[pos]) and ipa_phonemes[pos] not in _PUNCTUATION_MAP:
             p = ipa_phonemes[pos]
-            if p in _SKIP or unicodedata.category(p).startswith("M"):
+            if _is_modifier(p):
                 if p == "ˈ":
                     is_primary = True
                 elif p == "ˌ":
@@ -347,7 +361,7 @@ def ipa_to_pinyin(
         _coda_kept: list[tuple[str, str, str]] = []  # (initial, final, tone)
         while pos < n:
             nxt = ipa_phonemes[pos]
-            if nxt in _SKIP or unicodedata.category(nxt).startswith("M"):
+            if _is_modifier(nxt):
                 pos += 1
                 continue
             if nxt == "ː":
@@ -360,11 +374,7 @@ def ipa_to_pinyin(
             # e.g., "are" → a + er, "star" → si-ta-er
             # But only if it's truly a coda (not onset of next syllable)
             if nxt in ("ɹ", "r"):
-                peek = pos + 1
-                while peek < n and (ipa_phonemes[peek] in _SKIP
-                                    or unicodedata.category(ipa_phonemes[peek]).startswith("M")
-                                    or ipa_phonemes[peek] == "ː"):
-                    peek += 1
+                peek = _skip_modifiers(ipa_phonemes, pos + 1)
                 if peek < n and _is_vowel(ipa_phonemes[peek]):
                     break  # r is onset of next syllable (e.g., "very")
                 # Coda r — emit current syllable, then queue an er syllable
@@ -376,11 +386,7 @@ def ipa_to_pinyin(
 
             # Nasal coda — merge into final if it's truly a coda
             if nxt in _NASAL_CODAS:
-                peek = pos + 1
-                while peek < n and (ipa_phonemes[peek] in _SKIP
-                                    or unicodedata.category(ipa_phonemes[peek]).startswith("M")
-                                    or ipa_phonemes[peek] == "ː"):
-                    peek += 1
+                peek = _skip_modifiers(ipa_phonemes, pos + 1)
                 if peek < n and _is_vowel(ipa_phonemes[peek]):
                     break  # nasal is onset of next syllable, don't consume
                 merged = _NASAL_CODAS[nxt].get(final)
@@ -393,11 +399,7 @@ def ipa_to_pinyin(
             # Lateral coda (l) — vocalize to ou (dark L ≈ [ʊ]).
             # "world" → wer-ou, "girl" → ger-ou, "milk" → mi-ou
             if nxt == "l":
-                peek = pos + 1
-                while peek < n and (ipa_phonemes[peek] in _SKIP
-                                    or unicodedata.category(ipa_phonemes[peek]).startswith("M")
-                                    or ipa_phonemes[peek] == "ː"):
-                    peek += 1
+                peek = _skip_modifiers(ipa_phonemes, pos + 1)
                 if peek < n and _is_vowel(ipa_phonemes[peek]):
                     break  # l is onset of next syllable (e.g., "hello")
                 pos += 1
@@ -406,11 +408,7 @@ def ipa_to_pinyin(
 
             # Semivowel coda — vocalize: j→i, w→u
             if nxt in ("j", "w"):
-                peek = pos + 1
-                while peek < n and (ipa_phonemes[peek] in _SKIP
-                                    or unicodedata.category(ipa_phonemes[peek]).startswith("M")
-                                    or ipa_phonemes[peek] == "ː"):
-                    peek += 1
+                peek = _skip_modifiers(ipa_phonemes, pos + 1)
                 if peek < n and _is_vowel(ipa_phonemes[peek]):
                     break  # semivowel is onset of next syllable
                 _append_sv = "i" if nxt == "j" else "u"
@@ -421,11 +419,7 @@ def ipa_to_pinyin(
             #   stops  → always drop (Mandarin has no coda stops)
             #   sibilants → always keep (si5 ≈ syllabic s, weightless)
             #   others (f, h, …) → keep if stressed, drop if not
-            peek = pos + 1
-            while peek < n and (ipa_phonemes[peek] in _SKIP
-                                or unicodedata.category(ipa_phonemes[peek]).startswith("M")
-                                or ipa_phonemes[peek] == "ː"):
-                peek += 1
+            peek = _skip_modifiers(ipa_phonemes, pos + 1)
             if peek < n and _is_vowel(ipa_phonemes[peek]):
                 break  # consonant is onset of next syllable
 
@@ -543,6 +537,18 @@ def pinyin_to_ids(
     return ids
 
 
+@functools.lru_cache(maxsize=4)
+def _get_phonemizer(data_dir: object):
+    """Return a shared EspeakPhonemizer for *data_dir*.
+
+    Constructing one initialises espeak-ng and loads its data files, so it
+    is done once per data directory rather than on every synthesis call.
+    """
+    from piper.phonemize_espeak import EspeakPhonemizer
+
+    return EspeakPhonemizer(data_dir)
+
+
 def english_to_pinyin_phonemes(
     text: str,
     espeak_data_dir: object = None,
@@ -553,11 +559,10 @@ def english_to_pinyin_phonemes(
     ``ChinesePhonemizer.phonemize()`` so callers can feed the result
     directly into ``phonemes_to_ids()``.
     """
-    from piper.phonemize_espeak import EspeakPhonemizer
     from piper.voice import PiperVoice
 
     data_dir = espeak_data_dir or PiperVoice.espeak_data_dir
-    phonemizer = EspeakPhonemizer(data_dir)
+    phonemizer = _get_phonemizer(data_dir)
     ipa_sentences = phonemizer.phonemize("en-us", text)
 
     result: list[list[str]] = []
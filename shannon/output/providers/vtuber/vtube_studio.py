@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
-import uuid
+import secrets
 from typing import Any
 
 from shannon.output.providers.vtuber.base import VTuberProvider
@@ -12,6 +13,11 @@ from shannon.output.providers.vtuber.base import VTuberProvider
 _PLUGIN_NAME = "Shannon"
 _PLUGIN_DEVELOPER = "Shannon AI"
 
+# Request IDs only need to be unique per connection; a per-process nonce plus
+# a counter is far cheaper than a uuid4 for every mouth-parameter update.
+_REQUEST_PREFIX = secrets.token_hex(3)
+_request_counter = itertools.count()
+
 logger = logging.getLogger(__name__)
 
 
@@ -151,7 +157,7 @@ class VTubeStudioProvider(VTuberProvider):
         payload = {
             "apiName": "VTubeStudioPublicAPI",
             "apiVersion": "1.0",
-            "requestID": str(uuid.uuid4()),
+            "requestID": f"{_REQUEST_PREFIX}{next(_request_counter):09x}",
             "messageType": message_type,
             "data": data,
         }
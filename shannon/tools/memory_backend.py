@@ -74,19 +74,10 @@ class MemoryBackend:
         """Dispatch a tool params dict to the appropriate handler."""
         command = params.get("command", "")
         try:
-            if command == "view":
-                return self._view(params)
-            if command == "create":
-                return self._create(params)
-            if command == "str_replace":
-                return self._str_replace(params)
-            if command == "insert":
-                return self._insert(params)
-            if command == "delete":
-                return self._delete(params)
-            if command == "rename":
-                return self._rename(params)
-            return f"Error: Unknown command '{command}'"
+            name = self._COMMANDS.get(command)
+            if name is None:
+                return f"Error: Unknown command '{command}'"
+            return getattr(self, name)(params)
         except ValueError as e:
             return str(e)
         except Exception as e:
@@ -178,11 +169,13 @@ class MemoryBackend:
 
         local = self._resolve(path_str)
 
-        if local.exists():
-            return f"Error: File {path_str} already exists"
-
         local.parent.mkdir(parents=True, exist_ok=True)
-        local.write_text(file_text, encoding="utf-8")
+        # "x" fails if the file exists, so there is no check-then-write race.
+        try:
+            with open(local, "x", encoding="utf-8") as f:
+                f.write(file_text)
+        except FileExistsError:
+            return f"Error: File {path_str} already exists"
         return f"File created successfully at: {path_str}"
 
     def _str_replace(self, params: dict) -> str:
@@ -293,3 +286,13 @@ class MemoryBackend:
         new_local.parent.mkdir(parents=True, exist_ok=True)
         local.rename(new_local)
         return f"Successfully renamed {path_str} to {new_path_str}"
+
+    # Command name -> handler method name, resolved with getattr in execute().
+    _COMMANDS = {
+        "view": "_view",
+        "create": "_create",
+        "str_replace": "_str_replace",
+        "insert": "_insert",
+        "delete": "_delete",
+        "rename": "_rename",
+    }
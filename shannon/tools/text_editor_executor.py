@@ -33,16 +33,10 @@ class TextEditorExecutor:
         path = params.get("path", "")
 
         try:
-            if command == "view":
-                return self._view(path, params.get("view_range"))
-            elif command == "create":
-                return self._create(path, params.get("file_text", ""))
-            elif command == "str_replace":
-                return self._str_replace(path, params.get("old_str", ""), params.get("new_str", ""))
-            elif command == "insert":
-                return self._insert(path, params.get("insert_line", 0), params.get("insert_text", ""))
-            else:
+            name = self._COMMANDS.get(command)
+            if name is None:
                 return f"Unknown command: {command}"
+            return getattr(self, name)(params)
         except Exception as e:
             logger.exception("Text editor command '%s' failed on %s", command, path)
             return f"Error: {e}"
@@ -51,7 +45,9 @@ class TextEditorExecutor:
     # _view
     # ------------------------------------------------------------------
 
-    def _view(self, path: str, view_range: list[int] | None) -> str:
+    def _view(self, params: dict[str, Any]) -> str:
+        path = params.get("path", "")
+        view_range = params.get("view_range")
         p = Path(path).resolve()
         if not p.exists():
             return f"The path {path} does not exist. Please provide a valid path."
@@ -107,19 +103,26 @@ class TextEditorExecutor:
     # _create
     # ------------------------------------------------------------------
 
-    def _create(self, path: str, file_text: str) -> str:
+    def _create(self, params: dict[str, Any]) -> str:
+        path = params.get("path", "")
+        file_text = params.get("file_text", "")
         p = Path(path).resolve()
-        if p.exists():
-            return f"Error: File {path} already exists"
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(file_text, encoding="utf-8")
+        try:
+            with open(p, "x", encoding="utf-8") as f:
+                f.write(file_text)
+        except FileExistsError:
+            return f"Error: File {path} already exists"
         return f"File created successfully at {path}"
 
     # ------------------------------------------------------------------
     # _str_replace
     # ------------------------------------------------------------------
 
-    def _str_replace(self, path: str, old_str: str, new_str: str) -> str:
+    def _str_replace(self, params: dict[str, Any]) -> str:
+        path = params.get("path", "")
+        old_str = params.get("old_str", "")
+        new_str = params.get("new_str", "")
         p = Path(path).resolve()
         if not p.exists() or p.is_dir():
             return f"The path {path} does not exist. Please provide a valid path."
@@ -163,7 +166,10 @@ class TextEditorExecutor:
     # _insert
     # ------------------------------------------------------------------
 
-    def _insert(self, path: str, insert_line: int, insert_text: str) -> str:
+    def _insert(self, params: dict[str, Any]) -> str:
+        path = params.get("path", "")
+        insert_line = params.get("insert_line", 0)
+        insert_text = params.get("insert_text", "")
         p = Path(path).resolve()
         if not p.exists() or p.is_dir():
             return f"The path {path} does not exist. Please provide a valid path."
@@ -192,3 +198,11 @@ class TextEditorExecutor:
         lines.insert(insert_line, insert_text)
         p.write_text("".join(lines), encoding="utf-8")
         return f"Text inserted at line {insert_line} in {path}"
+
+    # Command name -> handler method name, resolved with getattr in execute().
+    _COMMANDS = {
+        "view": "_view",
+        "create": "_create",
+        "str_replace": "_str_replace",
+        "insert": "_insert",
+    }
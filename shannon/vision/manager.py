@@ -34,6 +34,10 @@ class VisionManager:
         self._running = True
         while self._running:
             start = asyncio.get_running_loop().time()
+            # Nobody listening — don't pay for the capture.
+            if not self._bus.has_subscribers(VisionFrame):
+                await asyncio.sleep(self._interval)
+                continue
             for provider in self._providers:
                 try:
                     image = await provider.capture()
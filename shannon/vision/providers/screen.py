@@ -2,22 +2,21 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from shannon.vision.providers.base import VisionProvider
 
+if TYPE_CHECKING:
+    from PIL import Image
 
-def _resize_image(png_bytes: bytes, max_width: int, max_height: int) -> bytes:
-    """Resize a PNG image to fit within max_width x max_height, preserving aspect ratio.
 
-    Returns original bytes if already within bounds.
-    """
+def _fit_to_png(img: Image.Image, max_width: int, max_height: int) -> bytes:
+    """Shrink *img* in place to fit max_width x max_height and encode it as PNG."""
     import io
     from PIL import Image
 
-    img = Image.open(io.BytesIO(png_bytes))
-    if img.width <= max_width and img.height <= max_height:
-        return png_bytes
-
-    img.thumbnail((max_width, max_height), Image.LANCZOS)
+    if img.width > max_width or img.height > max_height:
+        img.thumbnail((max_width, max_height), Image.LANCZOS)
     buf = io.BytesIO()
     img.save(buf, format="PNG")
     return buf.getvalue()
@@ -37,14 +36,19 @@ class ScreenCapture(VisionProvider):
         return await loop.run_in_executor(None, self._capture_sync)
 
     def _capture_sync(self) -> bytes:
-        """Synchronous capture implementation."""
+        """Synchronous capture implementation.
+
+        Builds the image from raw pixels (as computer.screenshot does) so the
+        frame is PNG-encoded once, after resizing, rather than encoded at full
+        resolution, decoded, and encoded again.
+        """
         import mss
-        import mss.tools
+        from PIL import Image
         with mss.mss() as sct:
             monitor = sct.monitors[1]  # primary monitor (monitors[0] is combined virtual screen)
             screenshot = sct.grab(monitor)
-            png_bytes = mss.tools.to_png(screenshot.rgb, screenshot.size)
-        return _resize_image(png_bytes, self._max_width, self._max_height)
+            img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+        return _fit_to_png(img, self._max_width, self._max_height)
 
     def source_name(self) -> str:
         return "screen"
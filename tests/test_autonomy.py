@@ -145,7 +145,7 @@ async def test_per_trigger_type_cooldown():
 
     bus.subscribe(AutonomousTrigger, capture)
 
-    loop._last_input_time = time.time() - 100
+    loop._last_input_time = time.monotonic() - 100
     await loop._evaluate()
     assert len(triggers) == 1
     assert triggers[0].reason == "idle_timeout"
@@ -176,3 +176,32 @@ async def test_disabled_does_nothing():
     await asyncio.wait_for(loop.run(), timeout=1.0)
 
     assert len(received) == 0
+
+
+@pytest.mark.asyncio
+async def test_first_idle_trigger_fires_shortly_after_boot(monkeypatch):
+    """The first trigger must fire even while monotonic time is below the cooldown."""
+    from types import SimpleNamespace
+    import shannon.autonomy.loop as loop_mod
+
+    # Monotonic clocks often start near zero at boot
+    clock = SimpleNamespace(monotonic=lambda: 5.0)
+    monkeypatch.setattr(loop_mod, "time", clock)
+
+    config = make_config(
+        enabled=True, triggers=["idle_timeout"], idle_timeout_seconds=1, cooldown_seconds=600,
+    )
+    bus = EventBus()
+    loop = AutonomyLoop(bus, config)
+    loop._last_input_time = 0.0
+
+    triggers = []
+
+    async def capture(e):
+        triggers.append(e)
+
+    bus.subscribe(AutonomousTrigger, capture)
+
+    await loop._evaluate()
+    assert len(triggers) == 1
+    assert triggers[0].reason == "idle_timeout"
@@ -362,6 +362,22 @@ async def test_brain_tool_exhaustion_caps_at_lower_iterations():
     assert fake_claude.call_count <= 11
 
 
+@pytest.mark.asyncio
+async def test_brain_tool_loop_leaves_stored_history_unchanged():
+    """History entries are shared with the turn's message list, not copied;
+    the tool loop must only append to that list, never alter the entries."""
+    fake_claude = FakeClaudeToolLoop(final_text="Done.")
+    bus, brain = _make_brain(fake_claude=fake_claude)
+    await brain.start()
+
+    await bus.publish(UserInput(text="First", source="text"))
+    before = [(m.role, m.content, list(m.tool_calls), list(m.tool_results)) for m in brain._history]
+
+    await bus.publish(UserInput(text="Second", source="text"))
+    after = [(m.role, m.content, list(m.tool_calls), list(m.tool_results)) for m in brain._history[:len(before)]]
+    assert after == before
+
+
 class FakeClaudeEmpty:
     """Returns empty text with no tool calls."""
     def __init__(self):
@@ -466,6 +482,36 @@ async def test_brain_chat_message_annotates_admin_participants():
     assert fake_claude.call_count >= 1
 
 
+@pytest.mark.asyncio
+async def test_brain_chat_message_admin_annotation_in_context():
+    """Only participants listed in admin_ids get the (admin) marker."""
+    seen: list[str] = []
+
+    class CapturingClaude(FakeClaude):
+        async def generate(self, messages, tools=None, betas=None):
+            seen.append(messages[-1].content)
+            return await super().generate(messages, tools, betas)
+
+    config = ShannonConfig()
+    config.messaging.admin_ids = ["123"]
+    bus = EventBus()
+    brain = Brain(
+        bus=bus, claude=CapturingClaude(), dispatcher=FakeDispatcher(),
+        registry=FakeRegistry(), config=config,
+    )
+    await brain.start()
+
+    await bus.publish(ChatMessage(
+        text="Hello!",
+        author="Alice",
+        platform="discord",
+        channel="general",
+        message_id="msg_1",
+        participants={"123": "Alice", "456": "Bob"},
+    ))
+    assert "Participants: Alice (admin), Bob" in seen[0]
+
+
 def test_prompt_builder():
     """PromptBuilder should include personality text in the built prompt."""
     personality = "You are Shannon, an AI VTuber."
@@ -556,6 +602,29 @@ async def test_brain_history_does_not_contain_images():
         assert msg.images == [], f"History msg has images: {len(msg.images)} images"
 
 
+@pytest.mark.asyncio
+async def test_brain_keeps_only_latest_vision_frame():
+    """Only the most recent VisionFrame should be attached to the next turn."""
+    from shannon.events import VisionFrame
+
+    sent_images: list[list[bytes]] = []
+
+    class CapturingClaude(FakeClaude):
+        async def generate(self, messages, tools=None, betas=None):
+            sent_images.append([img for m in messages for img in m.images])
+            return await super().generate(messages, tools, betas)
+
+    bus, brain = _make_brain(fake_claude=CapturingClaude())
+    await brain.start()
+
+    await bus.publish(VisionFrame(image=b"frame-1", source="screen"))
+    await bus.publish(VisionFrame(image=b"frame-2", source="screen"))
+    await bus.publish(UserInput(text="What do you see?", source="text"))
+
+    assert sent_images[0] == [b"frame-2"]
+    assert len(brain._vision_buffer) == 0
+
+
 class FakeClaudeYielding:
     """FakeClaude that yields to the event loop once per call, exposing interleaving opportunities."""
 
@@ -652,6 +721,57 @@ async def test_brain_tool_dispatch_exception_returns_error_result():
     assert any(r.text == "Done!" for r in llm_responses)
 
 
+class OrderRecordingDispatcher(FakeDispatcher):
+    """Records call start/finish so overlapping dispatches are visible."""
+    def __init__(self):
+        super().__init__()
+        self.events: list[str] = []
+
+    async def dispatch(self, tool_call):
+        self.events.append(f"start {tool_call.id}")
+        await asyncio.sleep(0)
+        self.events.append(f"end {tool_call.id}")
+        return f"result {tool_call.id}"
+
+
+class FakeClaudeThreeTools:
+    def __init__(self):
+        self.messages_per_call = []
+
+    async def generate(self, messages, tools=None, betas=None):
+        self.messages_per_call.append(list(messages))
+        if len(self.messages_per_call) == 1:
+            return LLMResponse(
+                text="",
+                tool_calls=[
+                    LLMToolCall(id="a", name="bash", arguments={"command": "git checkout x"}),
+                    LLMToolCall(id="e", name="set_expression", arguments={"name": "happy"}),
+                    LLMToolCall(id="b", name="str_replace_based_edit_tool", arguments={"command": "view"}),
+                ],
+                stop_reason="tool_use",
+            )
+        return LLMResponse(text="done", tool_calls=[], stop_reason="end_turn")
+
+
+@pytest.mark.asyncio
+async def test_brain_dispatches_tool_calls_sequentially_in_order():
+    """Tool calls can share the filesystem and screen, so each finishes before the next starts."""
+    fake_claude = FakeClaudeThreeTools()
+    dispatcher = OrderRecordingDispatcher()
+    bus, brain = _make_brain(fake_claude=fake_claude, fake_dispatcher=dispatcher)
+    await brain.start()
+
+    await bus.publish(UserInput(text="Run three", source="text"))
+
+    assert dispatcher.events == ["start a", "end a", "start b", "end b"]
+    results = fake_claude.messages_per_call[1][-1].tool_results
+    assert results == [
+        {"id": "a", "content": "result a"},
+        {"id": "e", "content": "ok"},
+        {"id": "b", "content": "result b"},
+    ]
+
+
 class FakeClaudePauseTurn:
     """Simulates pause_turn on first call (server-side tool in progress), then end_turn."""
     def __init__(self):
@@ -135,3 +135,85 @@ async def test_publish_handler_mutation_does_not_skip():
     await bus.publish(TestEvent())
 
     assert ran == [True]
+
+
+async def test_publish_handler_subscribing_does_not_see_current_event():
+    bus = EventBus()
+    ran = []
+
+    class TestEvent:
+        pass
+
+    async def late_handler(event: TestEvent):
+        ran.append("late")
+
+    async def subscribing_handler(event: TestEvent):
+        ran.append("first")
+        bus.subscribe(TestEvent, late_handler)
+
+    bus.subscribe(TestEvent, subscribing_handler)
+    await bus.publish(TestEvent())
+    assert ran == ["first"]
+
+    bus.unsubscribe(TestEvent, subscribing_handler)
+    await bus.publish(TestEvent())
+    assert ran == ["first", "late"]
+
+
+async def test_publish_exception_log_names_event_type(caplog):
+    bus = EventBus()
+
+    class BigEvent:
+        payload = b"\x00" * 1024
+
+        def __repr__(self):
+            raise AssertionError("event repr should not be formatted")
+
+    async def bad_handler(event: BigEvent):
+        raise RuntimeError("boom")
+
+    bus.subscribe(BigEvent, bad_handler)
+    await bus.publish(BigEvent())
+
+    assert "BigEvent event" in caplog.text
+
+
+async def test_has_subscribers():
+    bus = EventBus()
+
+    class TestEvent:
+        pass
+
+    async def handler(event: TestEvent):
+        pass
+
+    assert not bus.has_subscribers(TestEvent)
+    bus.subscribe(TestEvent, handler)
+    assert bus.has_subscribers(TestEvent)
+    bus.unsubscribe(TestEvent, handler)
+    assert not bus.has_subscribers(TestEvent)
+
+
+async def test_publish_runs_handlers_concurrently():
+    """A slow handler must not delay the other subscribers of the same event."""
+    bus = EventBus()
+    released = asyncio.Event()
+    fast_ran = []
+
+    class TestEvent:
+        pass
+
+    async def slow_handler(event: TestEvent):
+        # Only completes if the fast handler runs while this one is waiting.
+        await asyncio.wait_for(released.wait(), timeout=1.0)
+
+    async def fast_handler(event: TestEvent):
+        fast_ran.append(True)
+        released.set()
+
+    bus.subscribe(TestEvent, slow_handler)
+    bus.subscribe(TestEvent, fast_handler)
+    await bus.publish(TestEvent())
+
+    assert fast_ran == [True]
+    assert released.is_set()
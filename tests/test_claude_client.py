@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from shannon.brain.claude import ClaudeClient, _detect_media_type
+from shannon.brain.claude import ClaudeClient, _append_normalized, _detect_media_type
 from shannon.brain.types import LLMMessage, LLMResponse, LLMToolCall
 from shannon.config import LLMConfig
 
@@ -15,6 +15,14 @@ def make_client(**kwargs) -> ClaudeClient:
     return ClaudeClient(cfg)
 
 
+def normalize(api_messages: list[dict]) -> list[dict]:
+    """Run API-format messages through the merge step _build_messages uses."""
+    merged: list[dict] = []
+    for msg in api_messages:
+        _append_normalized(merged, msg)
+    return merged
+
+
 # ---------------------------------------------------------------------------
 # _build_messages tests
 # ---------------------------------------------------------------------------
@@ -220,7 +228,7 @@ def test_parse_response_multiple_text_blocks_joined():
 
 
 # ---------------------------------------------------------------------------
-# _normalize_messages tests
+# Message normalization tests
 # ---------------------------------------------------------------------------
 
 class TestNormalizeMessages:
@@ -280,37 +288,37 @@ class TestNormalizeMessages:
         assert "compacted" in texts
         assert "More text" in texts
 
-    def test_normalize_messages_does_not_merge_tool_result_with_string(self):
+    def test_append_normalized_does_not_merge_tool_result_with_string(self):
         """A tool_result message must not be merged with an adjacent plain-text message."""
         tool_result_block = {"type": "tool_result", "tool_use_id": "tu_1", "content": "done"}
         msgs = [
             {"role": "user", "content": [tool_result_block]},
             {"role": "user", "content": "Follow-up question"},
         ]
-        result = ClaudeClient._normalize_messages(msgs)
+        result = normalize(msgs)
         assert len(result) == 2
         assert result[0]["content"] == [tool_result_block]
         assert result[1]["content"] == "Follow-up question"
 
-    def test_normalize_messages_does_not_merge_string_with_tool_result(self):
+    def test_append_normalized_does_not_merge_string_with_tool_result(self):
         """A plain-text message must not be merged with an adjacent tool_result message."""
         tool_result_block = {"type": "tool_result", "tool_use_id": "tu_2", "content": "ok"}
         msgs = [
             {"role": "user", "content": "Initial message"},
             {"role": "user", "content": [tool_result_block]},
         ]
-        result = ClaudeClient._normalize_messages(msgs)
+        result = normalize(msgs)
         assert len(result) == 2
         assert result[0]["content"] == "Initial message"
         assert result[1]["content"] == [tool_result_block]
 
-    def test_normalize_messages_still_merges_two_strings(self):
+    def test_append_normalized_still_merges_two_strings(self):
         """Backward compatibility: two consecutive string-content messages still merge."""
         msgs = [
             {"role": "user", "content": "Hello"},
             {"role": "user", "content": "How are you?"},
         ]
-        result = ClaudeClient._normalize_messages(msgs)
+        result = normalize(msgs)
         assert len(result) == 1
         assert result[0]["role"] == "user"
         combined = result[0]["content"]
@@ -319,13 +327,13 @@ class TestNormalizeMessages:
         assert "Hello" in texts
         assert "How are you?" in texts
 
-    def test_normalize_messages_empty_content_merged(self):
+    def test_append_normalized_empty_content_merged(self):
         """Two consecutive user messages where one has empty string content merge without error."""
         msgs = [
             {"role": "user", "content": ""},
             {"role": "user", "content": "Non-empty message"},
         ]
-        result = ClaudeClient._normalize_messages(msgs)
+        result = normalize(msgs)
         assert len(result) == 1
         assert result[0]["role"] == "user"
         # empty string produces no blocks, only the non-empty message block remains
@@ -336,7 +344,6 @@ class TestNormalizeMessages:
 
 def test_normalize_does_not_merge_tool_use_messages():
     """Consecutive assistant messages containing tool_use blocks must not be merged."""
-    client = make_client()
     messages = [
         {"role": "assistant", "content": [
             {"type": "text", "text": "calling tool"},
@@ -347,7 +354,7 @@ def test_normalize_does_not_merge_tool_use_messages():
             {"type": "tool_use", "id": "tu2", "name": "bash", "input": {}},
         ]},
     ]
-    result = client._normalize_messages(messages)
+    result = normalize(messages)
     assert len(result) == 2
     assert result[0]["content"][1]["id"] == "tu1"
     assert result[1]["content"][1]["id"] == "tu2"
@@ -355,7 +362,6 @@ def test_normalize_does_not_merge_tool_use_messages():
 
 def test_normalize_does_not_merge_tool_result_messages():
     """Consecutive user messages containing tool_result blocks must not be merged."""
-    client = make_client()
     messages = [
         {"role": "user", "content": [
             {"type": "tool_result", "tool_use_id": "tu1", "content": "ok"},
@@ -364,7 +370,7 @@ def test_normalize_does_not_merge_tool_result_messages():
             {"type": "tool_result", "tool_use_id": "tu2", "content": "ok"},
         ]},
     ]
-    result = client._normalize_messages(messages)
+    result = normalize(messages)
     assert len(result) == 2
 
 
@@ -416,15 +422,13 @@ def test_build_messages_uses_detected_media_type():
     assert img_block["source"]["media_type"] == "image/jpeg"
 
 
-def test_normalize_messages_empty_same_role_merge():
+def test_append_normalized_empty_same_role_merge():
     """Two empty same-role messages must not be merged into a single empty-string message."""
-    from shannon.brain.claude import ClaudeClient
-
     msgs = [
         {"role": "assistant", "content": ""},
         {"role": "assistant", "content": ""},
     ]
-    result = ClaudeClient._normalize_messages(msgs)
+    result = normalize(msgs)
     # Both empty — cannot produce a single merged message with content "".
     # They are kept as separate messages rather than collapsed into bad state.
     assert not any(msg["content"] == "" and len(result) == 1 for msg in result)
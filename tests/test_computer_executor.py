@@ -61,6 +61,21 @@ async def test_left_click_calls_pyautogui_click(executor):
     assert "clicked" in result.lower() or result == "OK"
 
 
+@pytest.mark.parametrize("action,func", [
+    ("right_click", "rightClick"),
+    ("middle_click", "middleClick"),
+    ("double_click", "doubleClick"),
+    ("triple_click", "tripleClick"),
+])
+async def test_click_variants_call_matching_pyautogui_function(executor, action, func):
+    """Each click action maps to its own pyautogui function."""
+    with patch("shannon.computer.executor.pyautogui") as mock_pg:
+        result = await executor.execute({"action": action, "coordinate": [100, 200]})
+    getattr(mock_pg, func).assert_called_once_with(100, 200)
+    mock_pg.click.assert_not_called()
+    assert result == "OK"
+
+
 # ---------------------------------------------------------------------------
 # type
 # ---------------------------------------------------------------------------
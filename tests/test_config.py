@@ -585,3 +585,36 @@ def test_voice_config_merges_from_yaml(tmp_path):
     assert config.messaging.voice.enabled is True
     assert config.messaging.voice.silence_threshold == 3.0
     assert config.messaging.voice.auto_join_channels == ["12345"]
+
+
+def test_load_config_reuses_parsed_yaml(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"messaging": {"admin_ids": ["1"]}}))
+    first = load_config(str(config_file))
+    first.messaging.admin_ids.append("2")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("YAML re-parsed for unchanged file")
+
+    monkeypatch.setattr(yaml, "load", _fail)
+    second = load_config(str(config_file))
+    assert second.messaging.admin_ids == ["1"]
+
+
+def test_load_config_reparses_changed_yaml(tmp_path):
+    import os
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"memory": {"max_continues": 2}}))
+    assert load_config(str(config_file)).memory.max_continues == 2
+    config_file.write_text(yaml.dump({"memory": {"max_continues": 7}}))
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(str(config_file)).memory.max_continues == 7
+
+
+def test_config_import_does_not_load_yaml():
+    import subprocess
+    import sys
+    code = "import sys, shannon.config; print('yaml' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
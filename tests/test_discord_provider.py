@@ -84,6 +84,14 @@ class TestSplitMessageSentenceBoundary:
         assert all(len(c) <= 2000 for c in chunks)
 
 
+def test_split_message_long_text_preserves_content():
+    """Very long inputs split into in-limit chunks without losing words."""
+    text = "\n".join(f"Line {i} has a few words. And another sentence!" for i in range(5000))
+    chunks = split_message(text)
+    assert all(len(c) <= 2000 for c in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
 def test_split_message_space_split_no_trailing_whitespace():
     """Space-split chunks must not have trailing whitespace."""
     from shannon.messaging.providers.discord import split_message
@@ -122,3 +130,102 @@ def test_get_guild_emojis_caps_at_50():
     assert "emoji0" in result
     assert "emoji49" in result
     assert "emoji50" not in result
+
+
+def test_get_guild_emojis_reuses_line_until_emojis_change():
+    """The emoji line is rebuilt only when the guild's emoji tuple is replaced."""
+    from shannon.messaging.providers.discord import DiscordProvider
+    from unittest.mock import MagicMock
+
+    def make_emoji(name):
+        e = MagicMock()
+        e.name = name
+        e.available = True
+        return e
+
+    provider = DiscordProvider(token="test-token")
+    guild = MagicMock()
+    guild.id = 1
+    guild.emojis = (make_emoji("wave"),)
+
+    first = provider._get_guild_emojis(guild)
+    assert first == "Custom emojis: :wave:"
+    assert provider._get_guild_emojis(guild) is first
+
+    guild.emojis = (make_emoji("wave"), make_emoji("cat"))
+    assert provider._get_guild_emojis(guild) == "Custom emojis: :wave:, :cat:"
+
+
+async def test_download_attachments_keeps_order_and_skips_failures():
+    """Attachments download concurrently; failed reads are dropped, order is kept."""
+    from shannon.messaging.providers.discord import DiscordProvider
+    from unittest.mock import AsyncMock, MagicMock
+
+    def make_att(filename, read):
+        att = MagicMock()
+        att.filename = filename
+        att.size = 10
+        att.content_type = "text/plain"
+        att.read = read
+        return att
+
+    atts = [
+        make_att("a.txt", AsyncMock(return_value=b"a")),
+        make_att("broken.txt", AsyncMock(side_effect=OSError("404"))),
+        make_att("b.txt", AsyncMock(return_value=b"b")),
+    ]
+    result = await DiscordProvider._download_attachments(atts)
+    assert result == [
+        {"filename": "a.txt", "content_type": "text/plain", "data": b"a"},
+        {"filename": "b.txt", "content_type": "text/plain", "data": b"b"},
+    ]
+
+
+def _provider_with_channel():
+    from shannon.messaging.providers.discord import DiscordProvider
+    from unittest.mock import AsyncMock, MagicMock
+
+    provider = DiscordProvider(token="test-token")
+    channel = MagicMock()
+    channel.send = AsyncMock()
+    channel.fetch_message = AsyncMock()
+    partial = MagicMock()
+    partial.reply = AsyncMock()
+    partial.add_reaction = AsyncMock()
+    channel.get_partial_message = MagicMock(return_value=partial)
+    provider._client = MagicMock()
+    provider._client.get_channel = MagicMock(return_value=channel)
+    return provider, channel, partial
+
+
+async def test_send_message_replies_via_partial_message():
+    """Replies go through get_partial_message, with no fetch_message round trip."""
+    provider, channel, partial = _provider_with_channel()
+
+    await provider.send_message("123", "hello", reply_to="456")
+
+    channel.get_partial_message.assert_called_once_with(456)
+    partial.reply.assert_awaited_once_with("hello")
+    channel.fetch_message.assert_not_called()
+    channel.send.assert_not_called()
+
+
+async def test_send_message_falls_back_to_send_when_reply_fails():
+    """If the referenced message is gone, reply() raises and the chunk is sent standalone."""
+    provider, channel, partial = _provider_with_channel()
+    partial.reply.side_effect = RuntimeError("Unknown Message")
+
+    await provider.send_message("123", "hello", reply_to="456")
+
+    channel.send.assert_awaited_once_with("hello")
+
+
+async def test_add_reaction_uses_partial_message():
+    """Reactions go through get_partial_message, with no fetch_message round trip."""
+    provider, channel, partial = _provider_with_channel()
+
+    await provider.add_reaction("123", "456", "👍")
+
+    channel.get_partial_message.assert_called_once_with(456)
+    partial.add_reaction.assert_awaited_once_with("👍")
+    channel.fetch_message.assert_not_called()
@@ -208,6 +208,23 @@ def test_pcm_mono_to_48k_stereo_passthrough():
     assert len(result) == num_samples * 4  # 2 channels * 2 bytes
 
 
+def test_pcm_to_wav_matches_wave_module():
+    """The packed WAV header is byte-identical to what the wave module writes."""
+    import io
+    import wave
+    from shannon.messaging.providers.discord_voice import _pcm_to_wav
+
+    pcm = bytes(range(256)) * 10
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(pcm)
+
+    assert _pcm_to_wav(pcm, sample_rate=16000, channels=1) == buf.getvalue()
+
+
 # ---------------------------------------------------------------------------
 # RTP header parsing tests
 # ---------------------------------------------------------------------------
@@ -294,6 +311,18 @@ def test_user_audio_buffer_caps_at_max():
     assert len(data) <= max_bytes + 3840  # allow one extra frame tolerance
 
 
+def test_user_audio_buffer_drops_whole_oldest_frames():
+    """Trimming keeps frame boundaries and always keeps the newest frame."""
+    from shannon.messaging.providers.discord_voice import UserAudioBuffer
+
+    buf = UserAudioBuffer(max_seconds=0.04, sample_rate=48000, channels=2)  # 2 frames
+    for i in range(5):
+        buf.append(bytes([i]) * 3840)
+
+    data = buf.drain()
+    assert data == bytes([3]) * 3840 + bytes([4]) * 3840
+
+
 def test_user_audio_buffer_silence_detection():
     """silence_seconds should reflect time since last append."""
     from shannon.messaging.providers.discord_voice import UserAudioBuffer
@@ -534,6 +563,79 @@ async def test_voice_output_mutes_during_playback():
     assert muted_during_play is True
 
 
+@pytest.mark.asyncio
+async def test_voice_output_waits_for_previous_playback():
+    """A second VoiceOutput should start only after the first play() finishes."""
+    from shannon.messaging.providers.discord_voice import VoiceManager
+    from shannon.output.providers.tts.base import AudioChunk
+    from shannon.events import VoiceOutput
+
+    vm, bus, client = _make_voice_manager(enabled=True)
+
+    fake_vc = FakeVoiceClient()
+    fake_vc.channel = FakeVoiceChannel("vc_1")
+    vm._voice_clients["guild_1"] = fake_vc
+
+    afters = []
+    playing = []
+
+    def play(source, after):
+        playing.append(True)
+        afters.append(after)
+
+    def finish(error):
+        playing.clear()
+        afters[0](error)
+
+    fake_vc.play = MagicMock(side_effect=play)
+    fake_vc.is_playing = MagicMock(side_effect=lambda: bool(playing))
+
+    chunk = AudioChunk(data=b"\x00" * 100, sample_rate=22050, channels=1)
+    await vm._on_voice_output(VoiceOutput(audio=chunk, channel="vc_1"))
+    assert fake_vc.play.call_count == 1
+
+    second = asyncio.create_task(vm._on_voice_output(VoiceOutput(audio=chunk, channel="vc_1")))
+    await asyncio.sleep(0.01)
+    assert fake_vc.play.call_count == 1
+
+    finish(None)
+    await asyncio.wait_for(second, timeout=1.0)
+    assert fake_vc.play.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_voice_output_failed_play_keeps_waiting_on_is_playing():
+    """A play() that raises must not stop later outputs from waiting for the current clip."""
+    from shannon.output.providers.tts.base import AudioChunk
+    from shannon.events import VoiceOutput
+
+    vm, bus, client = _make_voice_manager(enabled=True)
+
+    fake_vc = FakeVoiceClient()
+    fake_vc.channel = FakeVoiceChannel("vc_1")
+    vm._voice_clients["guild_1"] = fake_vc
+
+    existing = asyncio.Event()
+    vm._playback_done["guild_1"] = existing
+    fake_vc.is_playing = MagicMock(return_value=False)
+    fake_vc.play = MagicMock(side_effect=RuntimeError("Already playing audio."))
+
+    chunk = AudioChunk(data=b"\x00" * 100, sample_rate=22050, channels=1)
+    await vm._on_voice_output(VoiceOutput(audio=chunk, channel="vc_1"))
+    assert vm._playback_done["guild_1"] is existing
+
+    fake_vc.is_playing.return_value = True
+    second = asyncio.create_task(vm._on_voice_output(VoiceOutput(audio=chunk, channel="vc_1")))
+    await asyncio.sleep(0.05)
+    assert not second.done(), "second output should still be waiting on is_playing()"
+    assert fake_vc.play.call_count == 1
+
+    fake_vc.is_playing.return_value = False
+    existing.set()
+    await asyncio.wait_for(second, timeout=1.0)
+    assert fake_vc.play.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_voice_output_no_matching_channel():
     """VoiceOutput for a channel we're not in should be silently dropped."""
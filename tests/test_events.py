@@ -215,3 +215,13 @@ def test_voice_state_change_join():
 def test_voice_state_change_leave():
     event = VoiceStateChange(user_id="123", user_name="Alice", channel=None)
     assert event.channel is None
+
+
+def test_events_use_slots():
+    import dataclasses
+    import shannon.events as events
+    for obj in vars(events).values():
+        if isinstance(obj, type) and dataclasses.is_dataclass(obj) and obj.__module__ == events.__name__:
+            assert "__slots__" in obj.__dict__, obj.__name__
+    with pytest.raises(AttributeError):
+        events.UserInput(text="hi", source="text").extra = 1
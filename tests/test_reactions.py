@@ -38,3 +38,8 @@ class TestExtractReactions:
         clean, reactions = extract_reactions("")
         assert clean == ""
         assert reactions == []
+
+    def test_reactions_inline_with_text(self):
+        clean, reactions = extract_reactions("Hi [react: 👋] there [react: 🎉]!")
+        assert clean == "Hi  there !"
+        assert reactions == ["👋", "🎉"]
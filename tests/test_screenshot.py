@@ -5,38 +5,57 @@ import pytest
 from shannon.computer.screenshot import ScreenCapture
 
 
-def test_resize_image_reduces_dimensions():
-    """_resize_image should scale down images exceeding max dimensions."""
-    from shannon.vision.providers.screen import _resize_image
+def test_fit_to_png_reduces_dimensions():
+    """_fit_to_png should scale down images exceeding max dimensions."""
+    from shannon.vision.providers.screen import _fit_to_png
     from PIL import Image
     import io
 
-    # Create a 1920x1080 test image
     img = Image.new("RGB", (1920, 1080), color="red")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    original_bytes = buf.getvalue()
 
-    resized = _resize_image(original_bytes, max_width=1024, max_height=768)
+    resized = _fit_to_png(img, max_width=1024, max_height=768)
 
     resized_img = Image.open(io.BytesIO(resized))
     assert resized_img.width <= 1024
     assert resized_img.height <= 768
 
 
-def test_resize_image_noop_when_small():
-    """_resize_image should return input unchanged when within bounds."""
-    from shannon.vision.providers.screen import _resize_image
+def test_fit_to_png_keeps_size_when_small():
+    """_fit_to_png should encode images within bounds at their original size."""
+    from shannon.vision.providers.screen import _fit_to_png
     from PIL import Image
     import io
 
     img = Image.new("RGB", (640, 480), color="blue")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    original_bytes = buf.getvalue()
 
-    resized = _resize_image(original_bytes, max_width=1024, max_height=768)
-    assert resized == original_bytes
+    encoded = Image.open(io.BytesIO(_fit_to_png(img, max_width=1024, max_height=768)))
+    assert encoded.size == (640, 480)
+
+
+def test_vision_capture_decodes_bgra_channel_order():
+    """Raw BGRA pixels from mss must come out as the right RGB colours."""
+    from unittest.mock import MagicMock, patch
+    from shannon.vision.providers.screen import ScreenCapture as VisionScreenCapture
+    from PIL import Image
+    import io
+
+    # Two pixels, BGRA: red then blue
+    grab = MagicMock()
+    grab.size = (2, 1)
+    grab.bgra = b"\x00\x00\xff\xff" + b"\xff\x00\x00\xff"
+    sct = MagicMock()
+    sct.__enter__ = MagicMock(return_value=sct)
+    sct.__exit__ = MagicMock(return_value=False)
+    sct.monitors = [None, {"width": 2, "height": 1}]
+    sct.grab.return_value = grab
+
+    with patch("mss.mss", return_value=sct):
+        png = VisionScreenCapture(max_width=1024, max_height=768)._capture_sync()
+
+    img = Image.open(io.BytesIO(png)).convert("RGB")
+    assert img.size == (2, 1)
+    assert img.getpixel((0, 0)) == (255, 0, 0)
+    assert img.getpixel((1, 0)) == (0, 0, 255)
 
 
 def test_scale_factor_small_screen():
@@ -89,6 +89,18 @@ def test_create_file_already_exists(executor, tmp_path):
     assert existing.read_text() == "original"
 
 
+def test_create_path_is_directory(executor, tmp_path):
+    target = tmp_path / "subdir"
+    target.mkdir()
+    result = executor.execute({
+        "command": "create",
+        "path": str(target),
+        "file_text": "content",
+    })
+    assert result == f"Error: File {target} already exists"
+    assert target.is_dir()
+
+
 # ---------------------------------------------------------------------------
 # _str_replace
 # ---------------------------------------------------------------------------
@@ -369,7 +381,7 @@ def test_create_writes_utf8(tmp_path):
 def test_unexpected_exception_returns_error_string(executor, tmp_path, monkeypatch):
     """Unexpected exceptions should be caught and returned as error strings."""
     import shannon.tools.text_editor_executor as te
-    def bad_view(self, path, view_range):
+    def bad_view(self, params):
         raise RuntimeError("disk on fire")
     monkeypatch.setattr(te.TextEditorExecutor, "_view", bad_view)
     result = executor.execute({"command": "view", "path": "/tmp/test"})
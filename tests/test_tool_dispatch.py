@@ -255,3 +255,31 @@ async def test_dispatch_bash_approved_via_bus():
 
     result = await dispatcher.dispatch(_make_call("bash", {"command": "ls"}))
     assert result == "output"
+
+
+async def test_confirmation_request_ids_are_unique():
+    """Each confirmation request gets a distinct request_id."""
+    from shannon.events import ToolConfirmationRequest, ToolConfirmationResponse
+
+    bus = EventBus()
+    config = ToolsConfig()
+    bash = AsyncMock(execute=AsyncMock(return_value="output"))
+    dispatcher = ToolDispatcher(
+        bash_executor=bash,
+        tools_config=config,
+        bus=bus,
+    )
+    seen: list[str] = []
+
+    async def auto_approve(event: ToolConfirmationRequest) -> None:
+        seen.append(event.request_id)
+        await bus.publish(ToolConfirmationResponse(
+            request_id=event.request_id, approved=True,
+        ))
+
+    bus.subscribe(ToolConfirmationRequest, auto_approve)
+
+    await dispatcher.dispatch(_make_call("bash", {"command": "ls"}))
+    await dispatcher.dispatch(_make_call("bash", {"command": "pwd"}))
+    assert len(seen) == 2
+    assert seen[0] != seen[1]
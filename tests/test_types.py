@@ -75,3 +75,11 @@ def test_llm_response_is_frozen():
     resp = LLMResponse(text="hello")
     with pytest.raises(AttributeError):
         resp.text = "changed"
+
+
+def test_llm_message_uses_slots():
+    """LLMMessage is allocated per turn and per tool iteration; no __dict__."""
+    msg = LLMMessage(role="user", content="Hello")
+    assert not hasattr(msg, "__dict__")
+    with pytest.raises(AttributeError):
+        msg.extra = 1
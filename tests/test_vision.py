@@ -219,6 +219,27 @@ async def test_manager_stops_emitting_after_stop():
     assert len(received_before) == 0
 
 
+@pytest.mark.asyncio
+async def test_manager_skips_capture_without_subscribers():
+    """Providers are not polled while nothing subscribes to VisionFrame."""
+    calls = 0
+
+    class CountingCapture(FakeScreenCapture):
+        async def capture(self) -> bytes:
+            nonlocal calls
+            calls += 1
+            return await super().capture()
+
+    bus = EventBus()
+    manager = VisionManager(bus, providers=[CountingCapture()], interval_seconds=0.02)
+
+    task = asyncio.create_task(manager.run())
+    await asyncio.sleep(0.1)
+    manager.stop()
+    await task
+    assert calls == 0
+
+
 @pytest.mark.asyncio
 async def test_manager_run_returns_after_stop():
     """manager.run() coroutine should complete after stop() is called."""